@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import re
+import threading
 from typing import List
 
 import ynca
 
-from homeassistant.config_entries import ConfigEntry, OperationNotAllowed
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
@@ -21,10 +22,11 @@ from .const import (
     CONF_SERIAL_URL,
     DATA_ZONES,
     DOMAIN,
+    INITIALIZE_TIMEOUT,
     LOGGER,
     MANUFACTURER_NAME,
     SERVICE_SEND_RAW_YNCA,
-    ZONE_ATTRIBUTE_NAMES,
+    ZONE_SUBUNIT_GETTERS,
 )
 from .helpers import DomainEntryData, receiver_requires_audio_input_workaround
 from .migrations import async_migrate_entry as migrations_async_migrate_entry
@@ -38,6 +40,9 @@ PLATFORMS: List[Platform] = [
     Platform.REMOTE,
 ]
 
+# Extract IP or hostname from socket://HOST:PORT
+_SOCKET_URL_RE = re.compile(r"socket://(.+):\d+")
+
 
 async def update_device_registry(
     hass: HomeAssistant, config_entry: ConfigEntry, receiver: ynca.YncaApi
@@ -46,40 +51,35 @@ async def update_device_registry(
 
     # Configuration URL for devices connected through IP
     configuration_url = None
-    if matches := re.match(
-        r"socket:\/\/(.+):\d+",  # Extract IP or hostname
-        config_entry.data[CONF_SERIAL_URL],
-    ):
+    if matches := _SOCKET_URL_RE.match(config_entry.data[CONF_SERIAL_URL]):
         configuration_url = f"http://{matches[1]}"
 
     # Add device explicitly to registry so other entities just have to report the identifier to link up
     registry = device_registry.async_get(hass)
 
-    for zone_attr_name in ZONE_ATTRIBUTE_NAMES:
-        if zone_subunit := getattr(receiver, zone_attr_name):
-            devicename = build_zone_devicename(receiver, zone_subunit)
-            registry.async_get_or_create(
-                config_entry_id=config_entry.entry_id,
-                identifiers={(DOMAIN, f"{config_entry.entry_id}_{zone_subunit.id}")},
-                manufacturer=MANUFACTURER_NAME,
-                name=devicename,
-                model=receiver.sys.modelname,
-                sw_version=receiver.sys.version,
-                configuration_url=configuration_url,
-            )
+    model = receiver.sys.modelname
+    sw_version = receiver.sys.version
 
-    if receiver.main and receiver.main.zonebavail is ynca.ZoneBAvail.READY:
-        devicename = build_zoneb_devicename(receiver)
+    def add_or_update_device(device_id: str, devicename: str):
         registry.async_get_or_create(
             config_entry_id=config_entry.entry_id,
-            identifiers={(DOMAIN, f"{config_entry.entry_id}_ZONEB")},
+            identifiers={(DOMAIN, f"{config_entry.entry_id}_{device_id}")},
             manufacturer=MANUFACTURER_NAME,
             name=devicename,
-            model=receiver.sys.modelname,
-            sw_version=receiver.sys.version,
+            model=model,
+            sw_version=sw_version,
             configuration_url=configuration_url,
         )
 
+    for _, get_zone_subunit in ZONE_SUBUNIT_GETTERS:
+        if zone_subunit := get_zone_subunit(receiver):
+            add_or_update_device(
+                zone_subunit.id, build_zone_devicename(receiver, zone_subunit)
+            )
+
+    if receiver.main and receiver.main.zonebavail is ynca.ZoneBAvail.READY:
+        add_or_update_device("ZONEB", build_zoneb_devicename(receiver))
+
 def build_zone_devicename(receiver, zone_subunit):
     devicename = f"{receiver.sys.modelname} {zone_subunit.id}"
     if (
@@ -112,9 +112,9 @@ async def update_configentry(
     if DATA_ZONES not in config_entry.data:
         new_data = dict(config_entry.data)
         zones = []
-        for zone_attr in ZONE_ATTRIBUTE_NAMES:
-            if getattr(receiver, zone_attr, None):
-                zones.append(zone_attr.upper())
+        for zone_attr_name, get_zone_subunit in ZONE_SUBUNIT_GETTERS:
+            if get_zone_subunit(receiver):
+                zones.append(zone_attr_name.upper())
         new_data[DATA_ZONES] = zones
         hass.config_entries.async_update_entry(config_entry, data=new_data)
 
@@ -163,10 +163,16 @@ type YamahaYncaConfigEntry = ConfigEntry[DomainEntryData]
 async def async_setup_entry(hass: HomeAssistant, entry: YamahaYncaConfigEntry) -> bool:
     """Set up Yamaha (YNCA) from a config entry."""
 
+    initialize_cancelled = threading.Event()
+
     def initialize_ynca(ynca_receiver: ynca.YncaApi):
         try:
             # Synchronous function taking a long time (> 10 seconds depending on receiver capabilities)
             ynca_receiver.initialize()
+            if initialize_cancelled.is_set():
+                # Setup timed out while initializing, nobody will use this receiver
+                ynca_receiver.close()
+                return False
             return True
         except ynca.YncaConnectionError as e:
             raise ConfigEntryNotReady(
@@ -186,24 +192,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: YamahaYncaConfigEntry) -
             )
             return False
 
+    def close_ynca(ynca_receiver: ynca.YncaApi):
+        ynca_receiver.close()
+
     def on_disconnect():
         # Reload the entry on disconnect.
         # HA will take care of re-init and retries
-        try:
-            asyncio.run_coroutine_threadsafe(
-                hass.config_entries.async_reload(entry.entry_id), hass.loop
-            ).result()
-        except OperationNotAllowed:  # pragma: no cover
-            # Can not reload when during setup
-            # Which is fine, so just let it go
-            pass
+        # Called from the YNCA thread, so schedule it without waiting for the reload
+        hass.loop.call_soon_threadsafe(
+            hass.config_entries.async_schedule_reload, entry.entry_id
+        )
 
     ynca_receiver = ynca.YncaApi(
         entry.data[CONF_SERIAL_URL],
         on_disconnect,
         COMMUNICATION_LOG_SIZE,
     )
-    initialized = await hass.async_add_executor_job(initialize_ynca, ynca_receiver)
+    try:
+        initialized = await asyncio.wait_for(
+            hass.async_add_executor_job(initialize_ynca, ynca_receiver),
+            timeout=INITIALIZE_TIMEOUT,
+        )
+    except TimeoutError as e:
+        # The initialize call keeps running in the executor, closing the receiver
+        # only helps when it is already connected. Flag the cancellation so
+        # initialize_ynca closes the receiver itself once initialize returns.
+        initialize_cancelled.set()
+        await hass.async_add_executor_job(close_ynca, ynca_receiver)
+        raise ConfigEntryNotReady(
+            "Timeout while initializing YNCA receiver %s" % entry.title
+        ) from e
 
     if initialized:
         await update_device_registry(hass, entry, ynca_receiver)
@@ -13,15 +13,15 @@ from .const import (
     DOMAIN,
     MAX_NUMBER_OF_SCENES,
     NUMBER_OF_SCENES_AUTODETECT,
-    ZONE_ATTRIBUTE_NAMES,
+    ZONE_SUBUNIT_GETTERS,
 )
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: YamahaYncaConfigEntry, async_add_entities: AddEntitiesCallback):
     domain_entry_data = config_entry.runtime_data
     entities = []
-    for zone_attr_name in ZONE_ATTRIBUTE_NAMES:
-        if zone_subunit := getattr(domain_entry_data.api, zone_attr_name):
+    for _, get_zone_subunit in ZONE_SUBUNIT_GETTERS:
+        if zone_subunit := get_zone_subunit(domain_entry_data.api):
             number_of_scenes = config_entry.options.get(zone_subunit.id, {}).get(
                 CONF_NUMBER_OF_SCENES, NUMBER_OF_SCENES_AUTODETECT
             )
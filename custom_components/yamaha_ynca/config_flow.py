@@ -27,6 +27,8 @@ STEP_ID_SERIAL = "serial"
 STEP_ID_NETWORK = "network"
 STEP_ID_ADVANCED = "advanced"
 
+_SOCKET_URL_RE = re.compile(r"socket://(?P<host>.+):(?P<port>\d+)")
+
 
 def get_serial_url_schema(user_input):
     return vol.Schema(
@@ -158,9 +160,8 @@ class YamahaYncaConfigFlow(ConfigFlow, domain=DOMAIN):
             data = {}
             if self.reconfigure_entry:
                 # Get HOST and PORT from socket://HOST:PORT
-                if m := re.match(
-                    r"socket://(?P<host>.+):(?P<port>\d+)",
-                    self.reconfigure_entry.data[CONF_SERIAL_URL],
+                if m := _SOCKET_URL_RE.match(
+                    self.reconfigure_entry.data[CONF_SERIAL_URL]
                 ):
                     data[CONF_HOST] = m.group("host")
                     data[CONF_PORT] = int(m.group("port"))
@@ -1,6 +1,7 @@
 """Constants for the Yamaha (YNCA) integration."""
 
 import logging
+import operator
 
 import ynca
 
@@ -9,6 +10,9 @@ LOGGER = logging.getLogger(__package__)
 
 COMMUNICATION_LOG_SIZE = 5000
 
+# Initialization takes > 10 seconds depending on receiver capabilities
+INITIALIZE_TIMEOUT = 60  # seconds
+
 CONF_SERIAL_URL = "serial_url"
 CONF_HOST = "host"
 CONF_PORT = "port"
@@ -34,6 +38,12 @@ ZONE_ATTRIBUTE_NAMES = [
     "zone4",
 ]
 
+# Getters for the zone subunits of a YncaApi instance
+ZONE_SUBUNIT_GETTERS = tuple(
+    (zone_attr_name, operator.attrgetter(zone_attr_name))
+    for zone_attr_name in ZONE_ATTRIBUTE_NAMES
+)
+
 CONF_HIDDEN_SOUND_MODES = "hidden_sound_modes"
 CONF_SELECTED_SOUND_MODES = "selected_sound_modes"
 CONF_HIDDEN_INPUTS = "hidden_inputs"
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import ynca
 
@@ -62,43 +62,48 @@ input_mappings: List[Mapping] = [
 ]
 
 
+def _build_subunit_attribute_names_by_input() -> Dict[ynca.Input, Tuple[str, ...]]:
+    names_by_input: Dict[ynca.Input, Tuple[str, ...]] = {}
+    for mapping in input_mappings:
+        names_by_input[mapping.ynca_input] = names_by_input.get(
+            mapping.ynca_input, ()
+        ) + tuple(mapping.subunit_attribute_names)
+    return names_by_input
+
+
+def _build_input_by_subunit_attribute_name() -> Dict[str, ynca.Input]:
+    input_by_name: Dict[str, ynca.Input] = {}
+    for mapping in input_mappings:
+        for subunit_attribute_name in mapping.subunit_attribute_names:
+            input_by_name.setdefault(subunit_attribute_name, mapping.ynca_input)
+    return input_by_name
+
+
+# Lookup tables so the input_mappings do not have to be searched every time
+SUBUNIT_ATTRIBUTE_NAMES_BY_INPUT = _build_subunit_attribute_names_by_input()
+INPUT_BY_SUBUNIT_ATTRIBUTE_NAME = _build_input_by_subunit_attribute_name()
+
+
 class InputHelper:
     @staticmethod
     def get_subunit_for_input(api: ynca.YncaApi, input: ynca.Input | None):
         """Returns Subunit of the current provided input if possible, otherwise None"""
-        for mapping in input_mappings:
-            if mapping.ynca_input is input:
-                for subunit_attribute_name in mapping.subunit_attribute_names:
-                    if subunit_attribute := getattr(api, subunit_attribute_name, None):
-                        return subunit_attribute
+        if input is None:
+            return None
+
+        for subunit_attribute_name in SUBUNIT_ATTRIBUTE_NAMES_BY_INPUT.get(input, ()):
+            if subunit_attribute := getattr(api, subunit_attribute_name, None):
+                return subunit_attribute
 
         return None
 
     @staticmethod
     def get_input_for_subunit(subunit: ynca.subunit.SubunitBase) -> ynca.Input:
         """Returns input of the provided subunit, raises ValueError if not found"""
-        for mapping in input_mappings:
-            if subunit.id.value.lower() in mapping.subunit_attribute_names:
-                return mapping.ynca_input
+        if input := INPUT_BY_SUBUNIT_ATTRIBUTE_NAME.get(subunit.id.value.lower()):
+            return input
         raise ValueError("Could not find input for subunit")
 
-    @staticmethod
-    def get_input_by_name(api: ynca.YncaApi, name: str) -> ynca.Input | None:
-        """Returns input by name"""
-        source_mapping = InputHelper.get_source_mapping(api)
-        for source_input, source_name in source_mapping.items():
-            if source_name == name.strip():
-                return source_input
-        return None
-
-    @staticmethod
-    def get_name_of_input(api: ynca.YncaApi, input: ynca.Input) -> str | None:
-        source_mapping = InputHelper.get_source_mapping(api)
-        for source_input, source_name in source_mapping.items():
-            if input is source_input:
-                return source_name
-        return None
-
     @staticmethod
     def get_source_mapping(api: ynca.YncaApi) -> Dict[ynca.Input, str]:
         """Mapping of input to sourcename for this YNCA instance."""
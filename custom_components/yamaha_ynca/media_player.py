@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 import voluptuous as vol  # type: ignore[import]
 import ynca
@@ -18,7 +18,7 @@ from homeassistant.components.media_player import (
     MediaType,
     RepeatMode,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     config_validation as cv,
@@ -36,11 +36,10 @@ from .const import (
     DOMAIN,
     LOGGER,
     SERVICE_STORE_PRESET,
-    ZONE_ATTRIBUTE_NAMES,
     ZONE_MAX_VOLUME,
     ZONE_MIN_VOLUME,
+    ZONE_SUBUNIT_GETTERS,
 )
-from .helpers import scale
 from .input_helpers import InputHelper
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -49,7 +48,87 @@ if TYPE_CHECKING:  # pragma: no cover
 
 STRAIGHT = "Straight"
 
-SUPPORTED_MEDIA_ID_TYPES = ["dabpreset", "fmpreset", "preset"]
+# Marker for cached values that have not been resolved yet
+_UNSET = object()
+
+# Lots of updates come in when switching sources (zone, SYS and input subunit)
+# Collapse them into one state update to avoid unneeded load and glitches in HA
+UPDATE_DEBOUNCE_DELAY = 0.200
+
+SUPPORTED_MEDIA_ID_TYPES = frozenset({"dabpreset", "fmpreset", "preset"})
+
+# Inputs that have limited playback control (aka only Play and Stop)
+LIMITED_PLAYBACK_CONTROL_INPUTS = frozenset(
+    {
+        ynca.Input.NETRADIO,
+        ynca.Input.SIRIUS,
+        ynca.Input.SIRIUS_IR,
+        ynca.Input.SIRIUS_XM,
+    }
+)
+
+# Inputs that provide radio channels (TUNER covers both TUN and DAB)
+RADIO_INPUTS = frozenset(
+    {
+        ynca.Input.TUNER,
+        ynca.Input.NETRADIO,
+        ynca.Input.SIRIUS,
+        ynca.Input.SIRIUS_IR,
+        ynca.Input.SIRIUS_XM,
+    }
+)
+
+
+def _playback_features_for_input(input: ynca.Input) -> MediaPlayerEntityFeature:
+    features = MediaPlayerEntityFeature(
+        MediaPlayerEntityFeature.PLAY | MediaPlayerEntityFeature.STOP
+    )
+    if input not in LIMITED_PLAYBACK_CONTROL_INPUTS:
+        if input is not ynca.Input.USB:
+            features |= MediaPlayerEntityFeature.PAUSE
+        features |= MediaPlayerEntityFeature.NEXT_TRACK
+        features |= MediaPlayerEntityFeature.PREVIOUS_TRACK
+    return features
+
+
+# Playback features for inputs with a subunit that supports playback
+PLAYBACK_FEATURES: Dict[ynca.Input, MediaPlayerEntityFeature] = {
+    input: _playback_features_for_input(input) for input in ynca.Input
+}
+
+
+def _tuner_channel(subunit) -> Optional[str]:
+    # AM/FM Tuner (TUN) and DAB/FM Tuner (DAB) share the TUNER input
+    # The type of band tells which one it is
+    band = subunit.band
+    if band is ynca.BandTun.AM:
+        return f"AM {subunit.amfreq} kHz"
+    if band is ynca.BandTun.FM:
+        return (
+            subunit.rdsprgservice
+            if subunit.rdsprgservice
+            else f"FM {subunit.fmfreq:.2f} MHz"
+        )
+    if band is ynca.BandDab.FM:
+        return (
+            subunit.fmrdsprgservice
+            if subunit.fmrdsprgservice
+            else f"FM {subunit.fmfreq:.2f} MHz"
+        )
+    if band is ynca.BandDab.DAB:
+        return subunit.dabservicelabel
+    return None
+
+
+# Channel name of the input subunit for inputs that provide channels
+CHANNEL_NAME_GETTERS: Dict[ynca.Input, Callable[[Any], Optional[str]]] = {
+    ynca.Input.TUNER: _tuner_channel,
+    ynca.Input.NETRADIO: lambda subunit: subunit.station or None,
+    ynca.Input.PANDORA: lambda subunit: subunit.station or None,
+    ynca.Input.SIRIUS: lambda subunit: subunit.chname or None,
+    ynca.Input.SIRIUS_IR: lambda subunit: subunit.chname or None,
+    ynca.Input.SIRIUS_XM: lambda subunit: subunit.chname or None,
+}
 
 
 async def async_setup_entry(
@@ -70,8 +149,8 @@ async def async_setup_entry(
     )
 
     entities: List[MediaPlayerEntity] = []
-    for zone_attr_name in ZONE_ATTRIBUTE_NAMES:
-        if zone_subunit := getattr(api, zone_attr_name):
+    for _, get_zone_subunit in ZONE_SUBUNIT_GETTERS:
+        if zone_subunit := get_zone_subunit(api):
             hidden_inputs = config_entry.options.get(zone_subunit.id, {}).get(
                 CONF_HIDDEN_INPUTS, []
             )
@@ -108,6 +187,10 @@ class YamahaYncaZone(MediaPlayerEntity):
 
     _ZONENAME_FUNCTION = "ZONENAME"
 
+    # Declared here because the `ynca` argument of __init__ shadows the module
+    _source_mapping: Dict[ynca.Input, str]
+    _inputs_reverse: Dict[str, ynca.Input]
+
     def __init__(
         self,
         receiver_unique_id: str,
@@ -123,6 +206,25 @@ class YamahaYncaZone(MediaPlayerEntity):
         self._hidden_sound_modes = hidden_sound_modes
         self._is_zone_b = is_zone_b
 
+        # Input subunit lookup is cached per update cycle as it is used by many properties
+        self._cached_input: Any = _UNSET
+        self._cached_input_subunit = None
+
+        # Source lookups, rebuilt together on first use after an update
+        self._input_caches_valid = False
+        self._source_mapping = {}
+        self._inputs_reverse = {}
+        self._sorted_sources: List[str] = []
+
+        # Sound modes only depend on availability of STRAIGHT and SOUNDPRG
+        self._sorted_sound_modes_key: Any = _UNSET
+        self._sorted_sound_modes: List[str] | None = None
+
+        self._debounced_update_handle: asyncio.TimerHandle | None = None
+
+        # Only the subunit of the current input is relevant for this zone
+        self._active_input_subunit = None
+
         if TYPE_CHECKING and is_zone_b:  # pragma: no cover
             assert isinstance(self._zone, Main)
 
@@ -148,15 +250,43 @@ class YamahaYncaZone(MediaPlayerEntity):
 
                 registry.async_update_device(device.id, name=devicename)
 
-        self.schedule_update_ha_state()
+        if function == "INP":
+            self._update_input_subunit_registration()
+
+        # Callbacks come from the YNCA thread, debounce in the eventloop
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_debounced_update)
+
+    @callback
+    def _async_schedule_debounced_update(self):
+        # Caches are cleared in the eventloop where the properties read them
+        self._cached_input = _UNSET
+        self._input_caches_valid = False
 
-    def _get_input_subunits(self):
-        for attribute in sorted(dir(self._ynca)):
-            if attribute in ["sys", "main", "zone2", "zone3", "zone4"]:
-                continue
-            if attribute_instance := getattr(self._ynca, attribute):
-                if isinstance(attribute_instance, ynca.subunit.SubunitBase):
-                    yield attribute_instance
+        if self._debounced_update_handle is not None:
+            self._debounced_update_handle.cancel()
+        self._debounced_update_handle = self.hass.loop.call_later(
+            UPDATE_DEBOUNCE_DELAY, self._async_debounced_update
+        )
+
+    @callback
+    def _async_debounced_update(self):
+        self._debounced_update_handle = None
+        self.async_write_ha_state()
+
+    def _update_input_subunit_registration(self):
+        # Called when adding the entity and on zone INP updates, so never
+        # unregisters from the subunit that is currently calling callbacks.
+        # Zone updates come from the YNCA thread, so look up the subunit directly
+        # and leave the input subunit cache to the eventloop.
+        input_subunit = InputHelper.get_subunit_for_input(self._ynca, self._zone.inp)
+        if input_subunit is self._active_input_subunit:
+            return
+
+        if self._active_input_subunit is not None:
+            self._active_input_subunit.unregister_update_callback(self.update_callback)
+        if input_subunit is not None:
+            input_subunit.register_update_callback(self.update_callback)
+        self._active_input_subunit = input_subunit
 
     async def async_added_to_hass(self):
         # Register to catch input renames on SYS
@@ -164,20 +294,30 @@ class YamahaYncaZone(MediaPlayerEntity):
         self._ynca.sys.register_update_callback(self.update_callback)
         self._zone.register_update_callback(self.update_callback)
 
-        for subunit in self._get_input_subunits():
-            subunit.register_update_callback(self.update_callback)
+        self._update_input_subunit_registration()
 
     async def async_will_remove_from_hass(self):
         assert self._ynca.sys is not None
         self._ynca.sys.unregister_update_callback(self.update_callback)
         self._zone.unregister_update_callback(self.update_callback)
 
-        for subunit in self._get_input_subunits():
-            subunit.unregister_update_callback(self.update_callback)
+        if self._active_input_subunit is not None:
+            self._active_input_subunit.unregister_update_callback(self.update_callback)
+            self._active_input_subunit = None
+
+        if self._debounced_update_handle is not None:
+            self._debounced_update_handle.cancel()
+            self._debounced_update_handle = None
 
     def _get_input_subunit(self):
-        if self._zone.inp is not None:
-            return InputHelper.get_subunit_for_input(self._ynca, self._zone.inp)
+        if self._cached_input is not self._zone.inp:
+            self._cached_input = self._zone.inp
+            self._cached_input_subunit = (
+                InputHelper.get_subunit_for_input(self._ynca, self._zone.inp)
+                if self._zone.inp is not None
+                else None
+            )
+        return self._cached_input_subunit
 
     @property
     def state(self):
@@ -200,30 +340,26 @@ class YamahaYncaZone(MediaPlayerEntity):
 
         return MediaPlayerState.IDLE
 
+    def _get_volume_range(self) -> float:
+        max_volume = (
+            self._zone.maxvol
+            if not self._is_zone_b and self._zone.maxvol is not None
+            else ZONE_MAX_VOLUME
+        )
+        return max_volume - ZONE_MIN_VOLUME
+
     @property
     def volume_level(self):
         """Volume level of the media player (0..1)."""
         if self._is_zone_b:
             if self._zone.zonebvol is not None:  # type: ignore[attr-defined]
-                return scale(
-                    self._zone.zonebvol,  # type: ignore[attr-defined]
-                    [ZONE_MIN_VOLUME, ZONE_MAX_VOLUME],
-                    [0, 1],
-                )
+                return (
+                    self._zone.zonebvol  # type: ignore[attr-defined]
+                    - ZONE_MIN_VOLUME
+                ) / self._get_volume_range()
         else:
             if self._zone.vol is not None:
-                return scale(
-                    self._zone.vol,
-                    [
-                        ZONE_MIN_VOLUME,
-                        (
-                            self._zone.maxvol
-                            if self._zone.maxvol is not None
-                            else ZONE_MAX_VOLUME
-                        ),
-                    ],
-                    [0, 1],
-                )
+                return (self._zone.vol - ZONE_MIN_VOLUME) / self._get_volume_range()
 
     @property
     def is_volume_muted(self):
@@ -235,26 +371,35 @@ class YamahaYncaZone(MediaPlayerEntity):
         if self._zone.mute is not None:
             return self._zone.mute != ynca.Mute.OFF
 
+    def _refresh_input_caches(self):
+        if self._input_caches_valid:
+            return
+
+        # Build all source lookups in a single pass over the source mapping
+        self._source_mapping = InputHelper.get_source_mapping(self._ynca)
+        self._inputs_reverse = {}
+        visible_sources = []
+        for input, name in self._source_mapping.items():
+            # First input wins on duplicate names, like a linear search would
+            self._inputs_reverse.setdefault(name, input)
+            if input.value not in self._hidden_inputs:
+                visible_sources.append(name)
+        self._sorted_sources = sorted(visible_sources, key=str.lower)
+
+        self._input_caches_valid = True
+
     @property
     def source(self):
         """Return the current input source."""
         if self._zone.inp is not None:
-            return (
-                InputHelper.get_name_of_input(self._ynca, self._zone.inp) or "Unknown"
-            )
+            self._refresh_input_caches()
+            return self._source_mapping.get(self._zone.inp) or "Unknown"
 
     @property
     def source_list(self) -> List[str]:
         """List of available sources."""
-        source_mapping = InputHelper.get_source_mapping(self._ynca)
-
-        filtered_sources = [
-            name
-            for input, name in source_mapping.items()
-            if input.value not in self._hidden_inputs
-        ]
-
-        return sorted(filtered_sources, key=str.lower)
+        self._refresh_input_caches()
+        return self._sorted_sources
 
     @property
     def sound_mode(self):
@@ -266,6 +411,13 @@ class YamahaYncaZone(MediaPlayerEntity):
     @property
     def sound_mode_list(self):
         """List of available sound modes."""
+        key = (self._zone.straight is not None, bool(self._zone.soundprg))
+        if key != self._sorted_sound_modes_key:
+            self._sorted_sound_modes = self._build_sound_mode_list()
+            self._sorted_sound_modes_key = key
+        return self._sorted_sound_modes
+
+    def _build_sound_mode_list(self):
         sound_modes = []
         if self._zone.straight is not None:
             sound_modes.append(STRAIGHT)
@@ -290,22 +442,13 @@ class YamahaYncaZone(MediaPlayerEntity):
 
         return sound_modes if sound_modes else None
 
-    def _has_limited_playback_controls(self, subunit):
-        """Indicates if subunit has limited playback control (aka only Play and Stop)"""
-        return (
-            subunit is self._ynca.netradio
-            or subunit is self._ynca.sirius
-            or subunit is self._ynca.siriusir
-            or subunit is self._ynca.siriusxm
-        )
-
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
         """Flag of media commands that are supported."""
 
         # Assume power is always supported
         # I can't initialize supported_command to nothing
-        supported_commands = (
+        supported_commands = MediaPlayerEntityFeature(
             MediaPlayerEntityFeature.TURN_ON | MediaPlayerEntityFeature.TURN_OFF
         )
 
@@ -323,14 +466,11 @@ class YamahaYncaZone(MediaPlayerEntity):
             supported_commands |= MediaPlayerEntityFeature.SELECT_SOUND_MODE
 
         if input_subunit := self._get_input_subunit():
+            # Playback support is a capability of the subunit so it is checked on
+            # every call, only the resulting features are looked up per input
             if getattr(input_subunit, "playback", None) is not None:
-                supported_commands |= MediaPlayerEntityFeature.PLAY
-                supported_commands |= MediaPlayerEntityFeature.STOP
-                if not self._has_limited_playback_controls(input_subunit):
-                    if input_subunit is not self._ynca.usb:
-                        supported_commands |= MediaPlayerEntityFeature.PAUSE
-                    supported_commands |= MediaPlayerEntityFeature.NEXT_TRACK
-                    supported_commands |= MediaPlayerEntityFeature.PREVIOUS_TRACK
+                assert self._zone.inp is not None
+                supported_commands |= PLAYBACK_FEATURES[self._zone.inp]
             if getattr(input_subunit, "repeat", None) is not None:
                 supported_commands |= MediaPlayerEntityFeature.REPEAT_SET
             if getattr(input_subunit, "shuffle", None) is not None:
@@ -373,24 +513,11 @@ class YamahaYncaZone(MediaPlayerEntity):
     def set_volume_level(self, volume):
         """Set volume level, convert range from 0..1."""
         if self._is_zone_b:
-            self._zone.zonebvol = scale(  # type: ignore[attr-defined]
-                volume,
-                [0, 1],
-                [ZONE_MIN_VOLUME, ZONE_MAX_VOLUME],
+            self._zone.zonebvol = (  # type: ignore[attr-defined]
+                ZONE_MIN_VOLUME + volume * self._get_volume_range()
             )
         else:
-            self._zone.vol = scale(
-                volume,
-                [0, 1],
-                [
-                    ZONE_MIN_VOLUME,
-                    (
-                        self._zone.maxvol
-                        if self._zone.maxvol is not None
-                        else ZONE_MAX_VOLUME
-                    ),
-                ],
-            )
+            self._zone.vol = ZONE_MIN_VOLUME + volume * self._get_volume_range()
 
     def volume_up(self):
         """Volume up media player."""
@@ -415,8 +542,9 @@ class YamahaYncaZone(MediaPlayerEntity):
 
     def select_source(self, source):
         """Select input source."""
-        if input := InputHelper.get_input_by_name(self._ynca, source):
-            self._zone.inp = input
+        self._refresh_input_caches()
+        if selected_input := self._inputs_reverse.get(source.strip()):
+            self._zone.inp = selected_input
 
     def select_sound_mode(self, sound_mode):
         """Switch the sound mode of the entity."""
@@ -484,22 +612,12 @@ class YamahaYncaZone(MediaPlayerEntity):
         elif repeat == RepeatMode.ONE:
             subunit.repeat = ynca.Repeat.SINGLE
 
-    def _is_radio_subunit(self, subunit: ynca.subunit.Subunit) -> bool:
-        return (
-            subunit is self._ynca.dab
-            or subunit is self._ynca.netradio
-            or subunit is self._ynca.tun
-            or subunit is self._ynca.sirius
-            or subunit is self._ynca.siriusir
-            or subunit is self._ynca.siriusxm
-        )
-
     # Media info
     @property
     def media_content_type(self) -> Optional[str]:
         """Content type of current playing media."""
         if subunit := self._get_input_subunit():
-            if self._is_radio_subunit(subunit):
+            if self._zone.inp in RADIO_INPUTS:
                 return MediaType.CHANNEL
             if (
                 getattr(subunit, "song", None) is not None
@@ -539,34 +657,9 @@ class YamahaYncaZone(MediaPlayerEntity):
     def media_channel(self) -> Optional[str]:
         """Channel currently playing."""
         if subunit := self._get_input_subunit():
-            if subunit is self._ynca.tun:
-                # AM/FM Tuner
-                if subunit.band is ynca.BandTun.AM:
-                    return f"AM {subunit.amfreq} kHz"
-                if subunit.band is ynca.BandTun.FM:
-                    return (
-                        subunit.rdsprgservice
-                        if subunit.rdsprgservice
-                        else f"FM {subunit.fmfreq:.2f} MHz"
-                    )
-            if subunit is self._ynca.dab:
-                # DAB/FM Tuner
-                if subunit.band is ynca.BandDab.FM:
-                    return (
-                        subunit.fmrdsprgservice
-                        if subunit.fmrdsprgservice
-                        else f"FM {subunit.fmfreq:.2f} MHz"
-                    )
-                if subunit.band is ynca.BandDab.DAB:
-                    return subunit.dabservicelabel
-
-            # Netradio
-            if station := getattr(subunit, "station", None):
-                return station
-
-            # Sirius variants
-            if channelname := getattr(subunit, "chname", None):
-                return channelname
+            assert self._zone.inp is not None
+            if get_channel_name := CHANNEL_NAME_GETTERS.get(self._zone.inp):
+                return get_channel_name(subunit)
         return None
 
     async def async_browse_media(
@@ -738,7 +831,7 @@ class YamahaYncaZone(MediaPlayerEntity):
         if not hasattr(self._ynca, media_id_subunit):
             raise HomeAssistantError(f"Malformed media id: {media_id}")
 
-        if media_id_command not in ["preset", "fmpreset", "dabpreset"]:
+        if media_id_command not in SUPPORTED_MEDIA_ID_TYPES:
             raise HomeAssistantError(f"Malformed media id: {media_id}")
 
         try:
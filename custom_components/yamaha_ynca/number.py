@@ -16,7 +16,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import YamahaYncaConfigEntry
-from .const import ZONE_ATTRIBUTE_NAMES, ZONE_MAX_VOLUME, ZONE_MIN_VOLUME
+from .const import ZONE_MAX_VOLUME, ZONE_MIN_VOLUME, ZONE_SUBUNIT_GETTERS
 from .helpers import YamahaYncaSettingEntity
 
 
@@ -127,8 +127,8 @@ async def async_setup_entry(
     domain_entry_data = config_entry.runtime_data
 
     entities = []
-    for zone_attr_name in ZONE_ATTRIBUTE_NAMES:
-        if zone_subunit := getattr(domain_entry_data.api, zone_attr_name):
+    for _, get_zone_subunit in ZONE_SUBUNIT_GETTERS:
+        if zone_subunit := get_zone_subunit(domain_entry_data.api):
             for entity_description in ENTITY_DESCRIPTIONS:
                 if getattr(zone_subunit, entity_description.key, None) is not None:
                     entities.append(
@@ -11,7 +11,12 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import YamahaYncaConfigEntry
-from .const import ATTR_COMMANDS, DOMAIN, ZONE_ATTRIBUTE_NAMES
+from .const import (
+    ATTR_COMMANDS,
+    DOMAIN,
+    ZONE_ATTRIBUTE_NAMES,
+    ZONE_SUBUNIT_GETTERS,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from ynca.subunits.zone import ZoneBase
@@ -98,8 +103,8 @@ async def async_setup_entry(
     domain_entry_data = config_entry.runtime_data
 
     entities = []
-    for zone_attr_name in ZONE_ATTRIBUTE_NAMES:
-        if zone_subunit := getattr(domain_entry_data.api, zone_attr_name):
+    for _, get_zone_subunit in ZONE_SUBUNIT_GETTERS:
+        if zone_subunit := get_zone_subunit(domain_entry_data.api):
             entities.append(
                 YamahaYncaZoneRemote(
                     config_entry.entry_id,
@@ -18,7 +18,7 @@ from .const import (
     CONF_SELECTED_SURROUND_DECODERS,
     SURROUNDDECODEROPTIONS_PLIIX_MAPPING,
     TWOCHDECODER_STRINGS,
-    ZONE_ATTRIBUTE_NAMES,
+    ZONE_SUBUNIT_GETTERS,
 )
 from .helpers import YamahaYncaSettingEntity, subunit_supports_entitydescription_key
 
@@ -41,8 +41,8 @@ async def async_setup_entry(
     domain_entry_data = config_entry.runtime_data
 
     entities = []
-    for zone_attr_name in ZONE_ATTRIBUTE_NAMES:
-        if zone_subunit := getattr(domain_entry_data.api, zone_attr_name):
+    for _, get_zone_subunit in ZONE_SUBUNIT_GETTERS:
+        if zone_subunit := get_zone_subunit(domain_entry_data.api):
             for entity_description in ENTITY_DESCRIPTIONS:
                 if entity_description.is_supported(zone_subunit):
                     entities.append(
@@ -12,7 +12,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import YamahaYncaConfigEntry
-from .const import ZONE_ATTRIBUTE_NAMES
+from .const import ZONE_SUBUNIT_GETTERS
 from .helpers import YamahaYncaSettingEntity, subunit_supports_entitydescription_key
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -142,8 +142,8 @@ async def async_setup_entry(
     domain_entry_data = config_entry.runtime_data
 
     entities = []
-    for zone_attr_name in ZONE_ATTRIBUTE_NAMES:
-        if zone_subunit := getattr(domain_entry_data.api, zone_attr_name):
+    for _, get_zone_subunit in ZONE_SUBUNIT_GETTERS:
+        if zone_subunit := get_zone_subunit(domain_entry_data.api):
             for entity_description in ZONE_ENTITY_DESCRIPTIONS:
                 if entity_description.is_supported(zone_subunit):
                     entities.append(
@@ -6,14 +6,10 @@ from unittest.mock import Mock
 
 import ynca
 
-from custom_components.yamaha_ynca.helpers import YamahaYncaSettingEntity, scale
+from custom_components.yamaha_ynca.helpers import YamahaYncaSettingEntity
 from homeassistant.helpers.entity import EntityDescription
 
 
-def test_scale(hass):
-    assert scale(1, [1, 10], [2, 11]) == 2
-
-
 TEST_ENTITY_DESCRIPTION = EntityDescription(
     key="key",
     name="EntityName",
@@ -1,6 +1,7 @@
 """Test the Yamaha (YNCA) config flow."""
 from __future__ import annotations
 
+import threading
 from unittest.mock import AsyncMock, call, patch
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry # type: ignore[import]
@@ -159,6 +160,34 @@ async def test_async_setup_entry_fails_with_initialization_failed_error(
     await hass.config_entries.async_unload(integration.entry.entry_id)
 
 
+async def test_async_setup_entry_fails_with_initialization_timeout(hass, mock_ynca):
+    """Test setup entry retries when initialize takes too long."""
+    integration = await setup_integration(hass, mock_ynca, skip_setup=True)
+
+    # Initialize hangs until released, like a receiver that does not respond
+    release_initialize = threading.Event()
+    mock_ynca.initialize.side_effect = lambda: release_initialize.wait(5)
+
+    with patch("ynca.YncaApi", return_value=mock_ynca), patch(
+        "custom_components.yamaha_ynca.INITIALIZE_TIMEOUT", 0.01
+    ):
+        await hass.config_entries.async_setup(integration.entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert integration.entry.state is ConfigEntryState.SETUP_RETRY
+    mock_ynca.close.assert_called_once()
+
+    # Receiver gets closed again when the orphaned initialize finally returns
+    closed_after_initialize = threading.Event()
+    mock_ynca.close.side_effect = closed_after_initialize.set
+    release_initialize.set()
+    assert await hass.async_add_executor_job(closed_after_initialize.wait, 5)
+    assert mock_ynca.close.call_count == 2
+
+    # Unload to avoid errors about "Lingering timer" which was started to retry setup
+    await hass.config_entries.async_unload(integration.entry.entry_id)
+
+
 async def test_async_setup_entry_fails_unknown_reason(hass, mock_ynca):
     """Test a successful setup entry."""
     integration = await setup_integration(hass, mock_ynca, skip_setup=True)
@@ -190,8 +219,7 @@ async def test_reload_on_disconnect(async_reload_mock, hass, mock_ynca, mock_zon
     mock_ynca.main = mock_zone_main
     integration = await setup_integration(hass, mock_ynca)
 
-    # on_disconnect gets called from a normal thread
-    # also do that in the test otherwise it will hang
+    # on_disconnect gets called from a normal thread, also do that in the test
     await hass.async_add_executor_job(integration.on_disconnect)
     await hass.async_block_till_done()
 
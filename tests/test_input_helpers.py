@@ -173,32 +173,6 @@ def test_sourcemapping_trim_whitepspace(mock_ynca):
     assert mapping[ynca.Input.HDMI4] == "Leading and trailing spaces"
 
 
-def test_get_name_of_input(mock_ynca):
-
-    mock_ynca.sys.inpnameusb = "_INPNAMEUSB_"
-
-    # Available input
-    name = InputHelper.get_name_of_input(mock_ynca, ynca.Input.USB)
-    assert name == "_INPNAMEUSB_"
-
-    # Unavailable input
-    name = InputHelper.get_name_of_input(mock_ynca, ynca.Input.HDMI1)
-    assert name is None
-
-
-def test_get_input_by_name(mock_ynca):
-
-    mock_ynca.sys.inpnameusb = "_INPNAMEUSB_"
-
-    # Available input
-    input = InputHelper.get_input_by_name(mock_ynca, "_INPNAMEUSB_")
-    assert input is ynca.Input.USB
-
-    # Unavailable input
-    input = InputHelper.get_input_by_name(mock_ynca, "Unknown")
-    assert input is None
-
-
 def test_get_subunit_for_input(mock_ynca):
 
     mock_ynca.usb = True
@@ -215,6 +189,10 @@ def test_get_subunit_for_input(mock_ynca):
     subunit = InputHelper.get_subunit_for_input(mock_ynca, ynca.Input.HDMI6)
     assert subunit is None
 
+    # No input
+    subunit = InputHelper.get_subunit_for_input(mock_ynca, None)
+    assert subunit is None
+
 
 def test_get_input_for_subunit_no_input():
     t = create_autospec(ynca.subunits.tun.Tun)
@@ -1,6 +1,7 @@
 """Test the Yamaha (YNCA) media_player entitity."""
 
 from __future__ import annotations
+from datetime import timedelta
 import logging
 
 from unittest.mock import Mock, create_autospec, patch
@@ -10,7 +11,9 @@ from pytest_unordered import unordered
 import ynca
 
 import custom_components.yamaha_ynca as yamaha_ynca
+from custom_components.yamaha_ynca.input_helpers import InputHelper
 from custom_components.yamaha_ynca.media_player import (
+    STRAIGHT,
     YamahaYncaZone,
     YamahaYncaZoneB,
 )
@@ -22,6 +25,10 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (  # type: ignore[import]
+    async_fire_time_changed,
+)
 
 from tests.conftest import setup_integration
 
@@ -37,8 +44,12 @@ def mp_entity_zoneb(mock_ynca, mock_zone_main_with_zoneb) -> YamahaYncaZoneB:
     return YamahaYncaZoneB("ReceiverUniqueId", mock_ynca, [])
 
 
-async def test_mediaplayer_entity(mp_entity: YamahaYncaZone, mock_zone, mock_ynca):
+async def test_mediaplayer_entity(
+    hass, mp_entity: YamahaYncaZone, mock_zone, mock_ynca
+):
     mock_ynca.netradio = create_autospec(ynca.subunits.netradio.NetRadio)
+    mock_ynca.usb = create_autospec(ynca.subunits.usb.Usb)
+    mock_zone.inp = ynca.Input.NETRADIO
 
     assert mp_entity.unique_id == "ReceiverUniqueId_ZoneId"
     assert mp_entity.device_info["identifiers"] == {
@@ -51,22 +62,76 @@ async def test_mediaplayer_entity(mp_entity: YamahaYncaZone, mock_zone, mock_ync
     await mp_entity.async_added_to_hass()
     mock_zone.register_update_callback.assert_called_once()
     mock_ynca.netradio.register_update_callback.assert_called_once()
+    mock_ynca.usb.register_update_callback.assert_not_called()
 
     zone_callback = mock_zone.register_update_callback.call_args.args[0]
     netradio_callback = mock_ynca.netradio.register_update_callback.call_args.args[0]
-    mp_entity.schedule_update_ha_state = Mock()
+    mp_entity.hass = hass
+    mp_entity.async_write_ha_state = Mock()
 
+    # Updates in quick succession result in a single state update
     zone_callback("FUNCTION", "VALUE")
-    mp_entity.schedule_update_ha_state.call_count == 1
+    netradio_callback("FUNCTION", "VALUE")
+    await hass.async_block_till_done()
+    assert mp_entity.async_write_ha_state.call_count == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    assert mp_entity.async_write_ha_state.call_count == 1
 
     netradio_callback("FUNCTION", "VALUE")
-    mp_entity.schedule_update_ha_state.call_count == 2
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    assert mp_entity.async_write_ha_state.call_count == 2
 
-    await mp_entity.async_will_remove_from_hass()
-    mock_zone.unregister_update_callback.assert_called_once_with(zone_callback)
+    # Input change moves registration to subunit of new input
+    mock_zone.inp = ynca.Input.USB
+    zone_callback("INP", ynca.Input.USB.value)
     mock_ynca.netradio.unregister_update_callback.assert_called_once_with(
         netradio_callback
     )
+    mock_ynca.usb.register_update_callback.assert_called_once()
+    usb_callback = mock_ynca.usb.register_update_callback.call_args.args[0]
+    await hass.async_block_till_done()
+
+    # Pending update is dropped on removal
+    await mp_entity.async_will_remove_from_hass()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    assert mp_entity.async_write_ha_state.call_count == 2
+    mock_zone.unregister_update_callback.assert_called_once_with(zone_callback)
+    mock_ynca.usb.unregister_update_callback.assert_called_once_with(usb_callback)
+
+
+async def test_mediaplayer_entity_input_subunit_lookup_cached(
+    mp_entity: YamahaYncaZone, mock_zone, mock_ynca
+):
+    mock_ynca.usb = create_autospec(ynca.subunits.usb.Usb)
+    mock_ynca.netradio = create_autospec(ynca.subunits.netradio.NetRadio)
+    mock_zone.inp = ynca.Input.USB
+
+    with patch.object(
+        InputHelper,
+        "get_subunit_for_input",
+        wraps=InputHelper.get_subunit_for_input,
+    ) as get_subunit_for_input:
+        # Repeated reads for the same input only look up the subunit once
+        mp_entity.media_album_name
+        mp_entity.media_artist
+        mp_entity.media_title
+        mp_entity.media_content_type
+        get_subunit_for_input.assert_called_once_with(mock_ynca, ynca.Input.USB)
+
+        # Input change results in a new lookup
+        mock_zone.inp = ynca.Input.NETRADIO
+        mp_entity.media_title
+        mp_entity.media_channel
+        assert get_subunit_for_input.call_count == 2
+        get_subunit_for_input.assert_called_with(mock_ynca, ynca.Input.NETRADIO)
+
+        # No input returns early without a lookup
+        mock_zone.inp = None
+        mp_entity.media_title
+        mp_entity.media_content_type
+        assert get_subunit_for_input.call_count == 2
 
 
 async def test_mediaplayer_entity_default_entity_name(
@@ -110,12 +175,14 @@ async def test_mediaplayer_entity_update_callback_zonename(
     await zone_entity.async_added_to_hass()
 
     zone_callback = mock_zone.register_update_callback.call_args.args[0]
-    zone_entity.schedule_update_ha_state = Mock()
+    zone_entity.async_write_ha_state = Mock()
 
     # Zonename update
     mock_zone.zonename = "New Zonename"
     zone_callback("ZONENAME", "VALUE")  # Note VALUE is not used it is read from API
-    assert zone_entity.schedule_update_ha_state.call_count == 1
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    assert zone_entity.async_write_ha_state.call_count == 1
 
     # Check for name change
     device_entry = device_reg.async_get_or_create(
@@ -147,12 +214,14 @@ async def test_mediaplayer_entity_update_callback_zonebname(
     await zoneb_entity.async_added_to_hass()
 
     zone_callback = mock_zone_main_with_zoneb.register_update_callback.call_args.args[0]
-    zoneb_entity.schedule_update_ha_state = Mock()
+    zoneb_entity.async_write_ha_state = Mock()
 
     # Zonename update
     mock_zone_main_with_zoneb.zonebname = "New ZoneBname"
     zone_callback("ZONEBNAME", "VALUE")  # Note VALUE is not used it is read from API
-    assert zoneb_entity.schedule_update_ha_state.call_count == 1
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    assert zoneb_entity.async_write_ha_state.call_count == 1
 
     # Check for name change
     device_entry = device_reg.async_get_or_create(
@@ -328,6 +397,36 @@ async def test_mediaplayer_entity_source_list(hass, mock_zone, mock_ynca):
     assert mp_entity.source_list == ["Input HDMI 4", "NET RADIO"]
 
 
+async def test_mediaplayer_entity_source_renamed(hass, mock_zone, mock_ynca):
+
+    mock_ynca.sys.inpnamehdmi4 = "Input HDMI 4"
+    mock_zone.inp = ynca.Input.HDMI4
+
+    mp_entity = YamahaYncaZone("ReceiverUniqueId", mock_ynca, mock_zone, [], [])
+    mp_entity.hass = hass
+    mp_entity.async_write_ha_state = Mock()
+    await mp_entity.async_added_to_hass()
+    sys_callback = mock_ynca.sys.register_update_callback.call_args.args[0]
+
+    assert mp_entity.source == "Input HDMI 4"
+    assert mp_entity.source_list == ["Input HDMI 4"]
+
+    # Rename on SYS is picked up after an update
+    mock_ynca.sys.inpnamehdmi4 = "Renamed HDMI 4"
+    sys_callback("INPNAMEHDMI4", "Renamed HDMI 4")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+
+    assert mp_entity.source == "Renamed HDMI 4"
+    assert mp_entity.source_list == ["Renamed HDMI 4"]
+
+    mock_zone.inp = None
+    mp_entity.select_source("Input HDMI 4")
+    assert mock_zone.inp is None
+    mp_entity.select_source("Renamed HDMI 4")
+    assert mock_zone.inp is ynca.Input.HDMI4
+
+
 async def test_mediaplayer_entity_source_whitespace_handling(
     hass, mock_zone, mock_ynca
 ):
@@ -409,6 +508,12 @@ async def test_mediaplayer_entity_sound_mode_list(mp_entity: YamahaYncaZone, moc
         [sp for sp in ynca.SoundPrg if sp is not ynca.SoundPrg.UNKNOWN]
     )
 
+    # Straight becoming available is picked up again
+    mock_zone.straight = ynca.Straight.OFF
+    assert mp_entity.sound_mode_list == sorted(
+        [sp for sp in ynca.SoundPrg if sp is not ynca.SoundPrg.UNKNOWN] + [STRAIGHT]
+    )
+
 
 @patch(
     "ynca.YncaModelInfo.get",
@@ -550,7 +655,9 @@ async def test_mediaplayer_playback_controls(mp_entity, mock_zone):
     mock_zone.playback.assert_called_with(ynca.Playback.SKIP_REV)
 
 
-async def test_mediaplayer_mediainfo(mp_entity: YamahaYncaZone, mock_zone, mock_ynca):
+async def test_mediaplayer_mediainfo(
+    hass, mp_entity: YamahaYncaZone, mock_zone, mock_ynca
+):
 
     assert mp_entity.media_album_name is None
     assert mp_entity.media_artist is None
@@ -623,6 +730,13 @@ async def test_mediaplayer_mediainfo(mp_entity: YamahaYncaZone, mock_zone, mock_
     mock_ynca.dab = create_autospec(ynca.subunits.dab.Dab)
     mock_ynca.tun = None  # Unit has either tun or dab, not both
 
+    # Input did not change, so an update is needed to pick up the other subunit
+    mp_entity.hass = hass
+    mp_entity.async_write_ha_state = Mock()
+    mp_entity.update_callback("BAND", ynca.BandDab.FM.value)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+
     # DAB FM can have name from RDS info or falls back to band and frequency
     mock_ynca.dab.band = ynca.BandDab.FM
     mock_ynca.dab.fmfreq = 123.45
@@ -648,6 +762,10 @@ async def test_mediaplayer_mediainfo(mp_entity: YamahaYncaZone, mock_zone, mock_
     assert mp_entity.media_channel == "DAB SERVICE LABEL"
     assert mp_entity.media_content_type is MediaType.CHANNEL
 
+    # No channel name without a known band
+    mock_ynca.dab.band = None
+    assert mp_entity.media_channel is None
+
     # Sirius subunits expose name by the "chname" attribute
     mock_zone.inp = ynca.Input.SIRIUS_IR
     mock_ynca.siriusir = create_autospec(ynca.subunits.sirius.SiriusIr)
@@ -657,6 +775,12 @@ async def test_mediaplayer_mediainfo(mp_entity: YamahaYncaZone, mock_zone, mock_
     assert mp_entity.media_channel == "ChannelName"
     assert mp_entity.media_content_type is MediaType.CHANNEL
 
+    # Pandora exposes name by the "station" attribute
+    mock_zone.inp = ynca.Input.PANDORA
+    mock_ynca.pandora = create_autospec(ynca.subunits.pandora.Pandora)
+    mock_ynca.pandora.station = "PandoraStationName"
+    assert mp_entity.media_channel == "PandoraStationName"
+
 
 async def test_mediaplayer_entity_shuffle(
     mp_entity: YamahaYncaZone, mock_zone, mock_ynca